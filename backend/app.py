@@ -1,19 +1,33 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional, Dict
 from calendar_manager import CalendarManager
 from schemas import Event, Task
 from scheduler_pipeline import SchedulerPipeline
 from prompt_generator import PromptGenerator
+from session_store import SessionStore
 from openai import OpenAI
 from dotenv import load_dotenv
+import asyncio
+import contextvars
+import copy
+import functools
+import hashlib
+import hmac
 import logging
-import uuid
+import queue
+import secrets
+import time
 import os
 import json
 import jwt
-from datetime import datetime, timedelta
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from datetime import datetime
 
 # Load environment variables
 load_dotenv()
@@ -31,50 +45,120 @@ class JsonFormatter(logging.Formatter):
         }
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_record)
+        elif record.exc_text:
+            # Records that crossed the log queue carry the pre-rendered
+            # traceback in exc_text (see _TracebackQueueHandler)
+            log_record["exception"] = record.exc_text
+        # orjson serializes the record in C; decode once since logging
+        # handlers expect str
+        return orjson.dumps(log_record).decode()
+
+# Per-request logging context. Handlers set it once at entry; a filter
+# stamps the ids onto every record, so no per-request LoggerAdapter (and
+# its dict + wrapper allocation) is needed.
+_log_ctx: contextvars.ContextVar[dict] = contextvars.ContextVar("log_ctx", default={})
+
+
+class ContextFilter(logging.Filter):
+    """Inject session_id/user_id from the current request context into records."""
+
+    def filter(self, record):
+        ctx = _log_ctx.get()
+        record.session_id = ctx.get("session_id", "N/A")
+        record.user_id = ctx.get("user_id", "N/A")
+        return True
+
+
+def _set_log_ctx(session_id: str, user_id: str) -> None:
+    _log_ctx.set({"session_id": session_id, "user_id": user_id})
+
 
 os.makedirs("logs", exist_ok=True)
-handler = logging.FileHandler("logs/scheduler.json")
-handler.setFormatter(JsonFormatter())
+file_handler = logging.FileHandler("logs/scheduler.json", delay=True)
+file_handler.setFormatter(JsonFormatter())
+
+# Coalesce INFO records into buffered writes (one write per 512 records);
+# ERRORs force an immediate flush so failures still hit disk right away.
+buffered_handler = MemoryHandler(capacity=512, flushLevel=logging.ERROR, target=file_handler)
+
+# Write log records from a background thread so request handlers never
+# block on disk I/O (FileHandler.emit holds the logging lock while it
+# write()s synchronously).
+log_queue: queue.Queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, buffered_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(buffered_handler.flush)
+
+# Attach the context filter at the handler level so records from the
+# calendar modules (which log via the root logger) get stamped too; the
+# QueueHandler runs in the request's task, where the ContextVar is live.
+class _TracebackQueueHandler(QueueHandler):
+    """QueueHandler that keeps exception text for the listener side.
+
+    The stock prepare() formats the record with this handler's (default)
+    formatter and nulls exc_info/exc_text, so the JsonFormatter behind
+    the listener would never emit its "exception" field. Render the
+    message and traceback here in the request thread and carry the
+    traceback across the queue in exc_text.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        record.stack_info = None
+        return record
+
+
+_exc_formatter = logging.Formatter()
+_ctx_filter = ContextFilter()
+queue_handler = _TracebackQueueHandler(log_queue)
+queue_handler.addFilter(_ctx_filter)
+stream_handler = logging.StreamHandler()
+stream_handler.addFilter(_ctx_filter)
 
 logging.basicConfig(
     level=logging.INFO,
-    handlers=[handler, logging.StreamHandler()]
+    handlers=[queue_handler, stream_handler]
 )
 logger = logging.getLogger("scheduler")
 
-def get_user_id(access_token: str, id_token: Optional[str] = None) -> str:
-    """Extract email from id_token (JWT) or fallback to access_token decoding."""
-    # Debug: Check if id_token was provided
-    if id_token:
-        logger.info(f"📧 Attempting to decode id_token (length: {len(id_token)})")
-    else:
-        logger.warning("⚠️ No id_token provided, will attempt to decode access_token (likely to fail)")
-    
-    # Prefer id_token if provided (it's guaranteed to be a JWT with user info)
-    token_to_decode = id_token if id_token else access_token
-    
+@functools.lru_cache(maxsize=4096)
+def _decode_email(token: str) -> Optional[str]:
+    """Extract the email claim from a JWT, cached by token string.
+
+    Tokens repeat across a session's requests, so the base64+JSON parse
+    only runs once per token. Returns None when the token isn't a JWT or
+    lacks an email claim — the negative result is cached too, so opaque
+    access tokens aren't re-parsed on every request.
+    """
     try:
         # Decode JWT without verification (we just want to read the claims)
-        decoded = jwt.decode(token_to_decode, options={"verify_signature": False})
+        decoded = jwt.decode(token, options={"verify_signature": False})
         email = decoded.get("email")
-        if email:
-            logger.info(f"✅ Successfully extracted email from {'id_token' if id_token else 'access_token'}: {email}")
-            return email
-        else:
-            logger.warning(f"⚠️ JWT decoded but no 'email' claim found. Claims: {list(decoded.keys())}")
+        if not email:
+            logger.warning("⚠️ JWT decoded but no 'email' claim found. Claims: %s", list(decoded.keys()))
+        return email
     except jwt.DecodeError:
         # Token is not a JWT - access tokens are opaque, id_tokens are JWTs
-        if id_token:
-            logger.warning("❌ id_token is not a valid JWT, cannot extract email")
-        else:
-            logger.warning("❌ Access token is not a JWT (expected for opaque tokens), cannot extract email")
+        logger.warning("❌ Token is not a valid JWT, cannot extract email")
     except Exception as e:
-        logger.warning(f"❌ Failed to decode token: {e}")
-    
-    return "unknown_user"
+        logger.warning("❌ Failed to decode token: %s", e)
+    return None
+
+
+def get_user_id(access_token: str, id_token: Optional[str] = None) -> str:
+    """Extract email from id_token (JWT) or fallback to access_token decoding."""
+    # Prefer id_token if provided (it's guaranteed to be a JWT with user info)
+    email = _decode_email(id_token if id_token else access_token)
+    return email if email else "unknown_user"
 
-app = FastAPI()
+# orjson serializes the event-heavy responses in Rust instead of the
+# pure-Python stdlib json encoder
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Allow CORS for local frontend dev
 app.add_middleware(
@@ -85,8 +169,117 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory session storage (in production, use Redis or database)
-sessions: Dict[str, Dict] = {}
+# Session storage: Redis-backed when REDIS_URL is set (required for
+# multi-worker deploys), in-memory otherwise. Sessions hold only
+# JSON-serializable state; managers are rebuilt from the access token.
+session_store = SessionStore()
+
+# Shared OpenAI client + prompt generator. Constructing OpenAI() builds an
+# httpx client (connection pool, SSL context), so do it once at import time
+# and reuse the pool across requests. PromptGenerator is stateless, so a
+# single instance serves all sessions; only CalendarManager binds a
+# per-user access token and stays per-request.
+openai_client = OpenAI(max_retries=2, timeout=30)
+prompt_generator = PromptGenerator(openai_client)
+
+# Serializes a whole event list in one pydantic-core pass instead of
+# N per-model .dict() calls.
+_event_list_adapter = TypeAdapter(List[Event])
+
+
+def dump_events(events) -> List[dict]:
+    """Dump events to JSON-ready dicts once per response."""
+    return _event_list_adapter.dump_python(list(events), mode="json")
+
+
+# Short-TTL cache for today's events so repeated refreshes don't each pay a
+# Google API round-trip. Keyed by a token digest (tokens never sit in memory
+# in plaintext) plus the date; invalidated whenever we write to the calendar.
+_TODAY_CACHE_TTL = 30  # seconds
+_TODAY_CACHE_MAX = 1024
+_today_events_cache: Dict[tuple, tuple] = {}
+
+
+def _today_cache_key(access_token: str) -> tuple:
+    digest = hashlib.sha256(access_token.encode()).digest()[:16]
+    return (digest, datetime.now().strftime("%Y-%m-%d"))
+
+
+async def _get_today_events_cached(access_token: str, calendar_manager: CalendarManager) -> List[Event]:
+    key = _today_cache_key(access_token)
+    cached = _today_events_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    events = await _run_gapi(calendar_manager.get_today_events)
+    if len(_today_events_cache) >= _TODAY_CACHE_MAX:
+        _today_events_cache.clear()
+    _today_events_cache[key] = (now + _TODAY_CACHE_TTL, events)
+    return events
+
+
+def _invalidate_today_events(access_token: str) -> None:
+    _today_events_cache.pop(_today_cache_key(access_token), None)
+
+
+# Google Calendar batch requests cap at 50 ops; bound concurrent batch
+# writes so we stay within per-user quota.
+_CALENDAR_BATCH_SIZE = 50
+_CALENDAR_WRITE_CONCURRENCY = 5
+
+
+# Dedicated pool for Google API calls, so calendar I/O and OpenAI calls
+# (which ride asyncio.to_thread's default executor) can't starve each other.
+_gapi_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="gapi")
+
+# Bound in-flight upstream calls per backend: a request burst queues here
+# instead of fanning out into rate-limit 429s and retries.
+_openai_semaphore = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_INFLIGHT", "8")))
+_gapi_semaphore = asyncio.Semaphore(int(os.getenv("GAPI_MAX_INFLIGHT", "32")))
+
+
+async def _run_gapi(fn, *args, **kwargs):
+    """Run a blocking Google API call on the calendar thread pool."""
+    async with _gapi_semaphore:
+        loop = asyncio.get_running_loop()
+        # run_in_executor doesn't propagate contextvars (unlike
+        # asyncio.to_thread), so carry the request's logging context over
+        # explicitly — records logged inside the calendar modules keep
+        # their session/user ids instead of falling back to "N/A"
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            _gapi_pool, functools.partial(ctx.run, fn, *args, **kwargs))
+
+
+async def _run_openai(fn, *args, **kwargs):
+    """Run a blocking OpenAI call on a worker thread, bounded in-flight."""
+    async with _openai_semaphore:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+def _token_digest(access_token: str) -> str:
+    """16-byte blake2b digest of an access token, hex-encoded for JSON.
+
+    Sessions store this instead of the raw token: the secret never sits in
+    the session store in cleartext, and verification compares 32 hex chars
+    instead of a ~200-byte token.
+    """
+    return hashlib.blake2b(access_token.encode(), digest_size=16).hexdigest()
+
+
+def get_verified_session(schedule_id: str, access_token: str) -> Dict:
+    """Fetch a session and verify its access token.
+
+    Shared by every /schedule/{id} endpoint (directly or via Depends);
+    compare_digest keeps the token check constant-time.
+    """
+    session = session_store.get(schedule_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Schedule session not found")
+    if not hmac.compare_digest(session["access_token_h"], _token_digest(access_token)):
+        raise HTTPException(status_code=403, detail="Access token mismatch")
+    return session
 
 class ScheduleRequest(BaseModel):
     rant: str
@@ -107,233 +300,320 @@ class TokenRequest(BaseModel):
     access_token: str
     id_token: Optional[str] = None  # JWT with user email
 
-class EventRequest(BaseModel):
-    access_token: str
-    events: List[Event]
-
 class CommitRequest(BaseModel):
     schedule_id: str
     access_token: str
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "really healthy"}
 
 @app.post("/schedule/generate")
-def generate_schedule(req: ScheduleRequest):
+async def generate_schedule(req: ScheduleRequest):
     """Generate initial schedule from a rant/description."""
-    session_id = str(uuid.uuid4())
+    session_id = secrets.token_urlsafe(16)
     user_id = get_user_id(req.access_token, req.id_token)
-    
-    # Create a contextual logger for this request
-    ctx_logger = logging.LoggerAdapter(logger, {"session_id": session_id, "user_id": user_id})
-    
+
+    _set_log_ctx(session_id, user_id)
+
     try:
-        ctx_logger.info(f"🚀 Generating schedule from rant (Length: {len(req.rant)})")
-        
-        # Initialize components
-        calendar_manager = CalendarManager(access_token=req.access_token)
-        client = OpenAI()
-        prompt_generator = PromptGenerator(client)
+        logger.info("🚀 Generating schedule from rant (Length: %d)", len(req.rant))
+
+        # Initialize components (CalendarManager hits the Google API in __init__,
+        # so keep it off the event loop)
+        calendar_manager = await _run_gapi(CalendarManager, access_token=req.access_token)
         scheduler_pipeline = SchedulerPipeline(calendar_manager, prompt_generator)
+
+        # One fused rant→schedule LLM call: the calendar read has to come
+        # first, but dropping the separate task-extraction round-trip
+        # saves far more than the lost overlap
+        existing_events = await _get_today_events_cached(req.access_token, calendar_manager)
+        logger.info("📅 Found %d existing events", len(existing_events))
+
+        schedule = await _run_openai(
+            scheduler_pipeline._generate_schedule_from_rant, existing_events, req.rant)
+        logger.info("🤖 Initial schedule generated with %d events", len(schedule))
         
-        # Step 1: Get existing events
-        existing_events = scheduler_pipeline._get_existing_events()
-        ctx_logger.info(f"📅 Found {len(existing_events)} existing events")
-        
-        # Step 2: Parse tasks from rant
-        tasks = prompt_generator.generate_tasks(req.rant)
-        ctx_logger.info(f"📋 Parsed {len(tasks)} tasks from rant")
-        
-        # Step 3: Generate initial schedule
-        schedule = scheduler_pipeline._generate_schedule(existing_events, tasks)
-        ctx_logger.info(f"🤖 Initial schedule generated with {len(schedule)} events")
-        
-        # Store session
-        sessions[session_id] = {
-            "calendar_manager": calendar_manager,
-            "scheduler_pipeline": scheduler_pipeline,
-            "current_schedule": schedule,
-            "created_at": datetime.now(),
-            "access_token": req.access_token,
+        # Store session (JSON-serializable payload only). The canonical
+        # prompt rendering is cached so feedback turns reuse a byte-stable
+        # prompt prefix (OpenAI prompt caching keys on exact bytes).
+        schedule_dicts = dump_events(schedule)
+        session_store.set(session_id, {
+            "current_schedule": schedule_dicts,
+            "schedule_str": prompt_generator.format_schedule_for_prompt(schedule),
+            "created_at": datetime.now().isoformat(),
+            "access_token_h": _token_digest(req.access_token),
             "user_id": user_id  # Cache user info
-        }
-        
-        _cleanup_old_sessions()
-        
+        })
+
         return {
             "schedule_id": session_id,
-            "schedule": [event.dict() for event in schedule],
+            "schedule": schedule_dicts,
             "message": "Schedule generated successfully."
         }
         
     except Exception as e:
-        ctx_logger.error(f"Failed to generate schedule: {e}", exc_info=True)
+        logger.error("Failed to generate schedule: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/schedule/generate/stream")
+async def generate_schedule_stream(req: ScheduleRequest):
+    """Stream schedule generation progress as NDJSON.
+
+    Emits one JSON object per line: a status line as each pipeline stage
+    completes, then one line per scheduled event, then a final line with
+    the schedule_id. Time-to-first-byte is the first stage instead of the
+    whole pipeline; non-streaming clients keep using /schedule/generate.
+    """
+    session_id = secrets.token_urlsafe(16)
+    user_id = get_user_id(req.access_token, req.id_token)
+    _set_log_ctx(session_id, user_id)
+
+    async def event_stream():
+        try:
+            logger.info("🚀 Streaming schedule generation from rant (Length: %d)", len(req.rant))
+            yield json.dumps({"type": "status", "stage": "started"}) + "\n"
+
+            calendar_manager = await _run_gapi(CalendarManager, access_token=req.access_token)
+            existing_events = await _get_today_events_cached(req.access_token, calendar_manager)
+            yield json.dumps({"type": "status", "stage": "events_loaded", "count": len(existing_events)}) + "\n"
+
+            # One fused rant→schedule LLM call (no separate task-extraction stage)
+            scheduler_pipeline = SchedulerPipeline(calendar_manager, prompt_generator)
+            schedule = await _run_openai(
+                scheduler_pipeline._generate_schedule_from_rant, existing_events, req.rant)
+            schedule_dicts = dump_events(schedule)
+
+            session_store.set(session_id, {
+                "current_schedule": schedule_dicts,
+                "schedule_str": prompt_generator.format_schedule_for_prompt(schedule),
+                "created_at": datetime.now().isoformat(),
+                "access_token_h": _token_digest(req.access_token),
+                "user_id": user_id
+            })
+
+            for event_dict in schedule_dicts:
+                yield json.dumps({"type": "event", "event": event_dict}) + "\n"
+            yield json.dumps({"type": "done", "schedule_id": session_id}) + "\n"
+        except Exception as e:
+            logger.error("Failed to stream schedule generation: %s", e, exc_info=True)
+            yield json.dumps({"type": "error", "detail": str(e)}) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
 @app.post("/schedule/feedback")
-def provide_feedback(req: FeedbackRequest):
+async def provide_feedback(req: FeedbackRequest):
     """Provide feedback to adjust the current schedule."""
-    if req.schedule_id not in sessions:
-        raise HTTPException(status_code=404, detail="Schedule session not found")
-    
-    session = sessions[req.schedule_id]
+    session = get_verified_session(req.schedule_id, req.access_token)
     user_id = session.get("user_id", "unknown")
-    
-    # Contextual logger with same session/user ID
-    ctx_logger = logging.LoggerAdapter(logger, {"session_id": req.schedule_id, "user_id": user_id})
-    
+
+    _set_log_ctx(req.schedule_id, user_id)
+
     try:
-        if session["access_token"] != req.access_token:
-            raise HTTPException(status_code=403, detail="Access token mismatch")
-        
-        ctx_logger.info(f"📝 Received feedback: '{req.feedback}'")
-        
-        scheduler_pipeline = session["scheduler_pipeline"]
-        current_schedule = session["current_schedule"]
-        
-        # Apply feedback
-        updated_schedule = scheduler_pipeline.prompt_generator.adjust_schedule_with_feedback(
-            current_schedule, req.feedback
+        logger.info("📝 Received feedback: %r", req.feedback)
+
+        # Rehydrate the schedule from the stored payload
+        current_schedule = [Event(**e) for e in session["current_schedule"]]
+
+        # Apply feedback (blocking LLM round-trip, so run it off the event
+        # loop). Pass the cached prompt rendering so the prompt prefix stays
+        # byte-identical across feedback turns.
+        updated_schedule = await _run_openai(
+            prompt_generator.adjust_schedule_with_feedback,
+            current_schedule, req.feedback, session.get("schedule_str")
         )
-        
-        ctx_logger.info(f"✅ Adjusted schedule (Events: {len(updated_schedule)})")
-        
+
+        logger.info("✅ Adjusted schedule (Events: %d)", len(updated_schedule))
+
         # Update session
-        session["current_schedule"] = updated_schedule
-        
+        schedule_dicts = dump_events(updated_schedule)
+        session["current_schedule"] = schedule_dicts
+        session["schedule_str"] = prompt_generator.format_schedule_for_prompt(updated_schedule)
+        session_store.set(req.schedule_id, session)
+
         return {
             "schedule_id": req.schedule_id,
-            "schedule": [event.dict() for event in updated_schedule],
+            "schedule": schedule_dicts,
             "message": "Schedule updated."
         }
         
     except Exception as e:
-        ctx_logger.error(f"Failed to process feedback: {e}", exc_info=True)
+        logger.error("Failed to process feedback: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/schedule/commit")
-def commit_schedule(req: CommitRequest):
-    """Commit the current schedule to the calendar."""
-    if req.schedule_id not in sessions:
-        raise HTTPException(status_code=404, detail="Schedule session not found")
-    
-    session = sessions[req.schedule_id]
-    user_id = session.get("user_id", "unknown")
-    ctx_logger = logging.LoggerAdapter(logger, {"session_id": req.schedule_id, "user_id": user_id})
-    
+def _run_commit(schedule_id: str, session: Dict, access_token: str) -> None:
+    """Blocking commit worker; runs on the threadpool after the 202 is sent."""
+    _set_log_ctx(schedule_id, session.get("user_id", "unknown"))
     try:
-        if session["access_token"] != req.access_token:
-            raise HTTPException(status_code=403, detail="Access token mismatch")
-        
-        calendar_manager = session["calendar_manager"]
-        current_schedule = session["current_schedule"]
-        
-        ctx_logger.info(f"💾 Committing schedule to calendar ({len(current_schedule)} events)")
-        
-        # Add/update events in calendar
+        # Rebuild the manager from the request token (sessions only hold
+        # JSON and never the raw secret)
+        calendar_manager = CalendarManager(access_token=access_token)
+        current_schedule = [Event(**e) for e in session["current_schedule"]]
         calendar_manager.add_events_to_calendar(current_schedule)
-        
-        # Count new vs modified events
-        new_count = sum(1 for e in current_schedule if not e.already_in_calendar)
-        modified_count = sum(1 for e in current_schedule if e.is_modified)
-        
-        ctx_logger.info(f"🎉 Commit successful: {new_count} new, {modified_count} moved")
-        
-        del sessions[req.schedule_id]
-        
+
+        # Count new vs modified events in a single pass
+        new_count = modified_count = 0
+        for e in current_schedule:
+            if not e.already_in_calendar:
+                new_count += 1
+            elif e.is_modified:
+                modified_count += 1
+
+        logger.info("🎉 Commit successful: %d new, %d moved", new_count, modified_count)
+        _invalidate_today_events(access_token)
+        session["commit_state"] = "done"
+        session["commit_message"] = f"Successfully processed {new_count} new and {modified_count} moved events"
+    except Exception as e:
+        logger.error("Failed to commit schedule: %s", e, exc_info=True)
+        session["commit_state"] = "error"
+        session["commit_message"] = str(e)
+    session_store.set(schedule_id, session)
+
+
+@app.post("/schedule/commit", status_code=202)
+async def commit_schedule(req: CommitRequest, background_tasks: BackgroundTasks):
+    """Commit the current schedule to the calendar.
+
+    Returns 202 immediately and performs the Google writes in the
+    background; clients poll GET /schedule/{id} for commit_state, so the
+    client round-trip is decoupled from the calendar API round-trips.
+    """
+    session = get_verified_session(req.schedule_id, req.access_token)
+    user_id = session.get("user_id", "unknown")
+    _set_log_ctx(req.schedule_id, user_id)
+
+    # Idempotency guard: a double-click or client retry must not queue a
+    # second background commit, which would re-insert every new event.
+    # Report the in-flight/finished state instead; only "error" (or a
+    # never-committed session) may start a commit.
+    if session.get("commit_state") in ("pending", "done"):
         return {
-            "message": f"Successfully processed {new_count} new and {modified_count} moved events",
-            "schedule": [event.dict() for event in current_schedule]
+            "schedule_id": req.schedule_id,
+            "status": session["commit_state"],
+            "message": session.get("commit_message")
+                       or "Commit already in progress; poll GET /schedule/{schedule_id} for status",
+            "schedule": session["current_schedule"]
         }
-    except Exception as e:
-        ctx_logger.error(f"Failed to commit schedule: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+
+    logger.info("💾 Committing schedule to calendar (%d events)",
+                    len(session["current_schedule"]))
+
+    session["commit_state"] = "pending"
+    session_store.set(req.schedule_id, session)
+    background_tasks.add_task(_run_commit, req.schedule_id, session, req.access_token)
+
+    return {
+        "schedule_id": req.schedule_id,
+        "status": "pending",
+        "message": "Commit accepted; poll GET /schedule/{schedule_id} for status",
+        "schedule": session["current_schedule"]
+    }
 
 @app.get("/schedule/{schedule_id}")
-def get_schedule(schedule_id: str, access_token: str):
+async def get_schedule(schedule_id: str, session: Dict = Depends(get_verified_session)):
     """Get the current schedule for a session."""
-    if schedule_id not in sessions:
-        raise HTTPException(status_code=404, detail="Schedule session not found")
-    
-    session = sessions[schedule_id]
     user_id = session.get("user_id", "unknown")
-    ctx_logger = logging.LoggerAdapter(logger, {"session_id": schedule_id, "user_id": user_id})
-    
+    _set_log_ctx(schedule_id, user_id)
+
     try:
-        if session["access_token"] != access_token:
-            raise HTTPException(status_code=403, detail="Access token mismatch")
-        
         return {
             "schedule_id": schedule_id,
-            "schedule": [event.dict() for event in session["current_schedule"]],
-            "created_at": session["created_at"].isoformat()
+            "schedule": session["current_schedule"],
+            "created_at": session["created_at"],
+            "commit_state": session.get("commit_state"),
+            "commit_message": session.get("commit_message")
         }
     except Exception as e:
-        ctx_logger.error(f"Failed to get schedule: {e}", exc_info=True)
+        logger.error("Failed to get schedule: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
-def _cleanup_old_sessions():
-    """Remove sessions older than 1 hour."""
-    cutoff_time = datetime.now() - timedelta(hours=1)
-    expired_sessions = [
-        session_id for session_id, session in sessions.items()
-        if session["created_at"] < cutoff_time
-    ]
-    for session_id in expired_sessions:
-        del sessions[session_id]
-
 @app.post("/calendar/today")
-def get_today_events(req: TokenRequest):
+async def get_today_events(req: TokenRequest):
     """Get today's events using the provided access token."""
     user_id = get_user_id(req.access_token, req.id_token)
-    ctx_logger = logging.LoggerAdapter(logger, {"session_id": "N/A", "user_id": user_id})
+    _set_log_ctx("N/A", user_id)
     try:
-        ctx_logger.info("📅 Fetching today's events for user")
-        calendar_manager = CalendarManager(access_token=req.access_token)
-        events = calendar_manager.get_today_events()
+        logger.info("📅 Fetching today's events for user")
+        calendar_manager = await _run_gapi(CalendarManager, access_token=req.access_token)
+        events = await _get_today_events_cached(req.access_token, calendar_manager)
         return {"events": [event.model_dump() for event in events]}
     except Exception as e:
-        ctx_logger.error(f"Failed to get today's events: {e}", exc_info=True)
+        logger.error("Failed to get today's events: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/calendar/test-event")
-def create_test_event(req: TokenRequest):
+async def create_test_event(req: TokenRequest):
     """Create a test event using the provided access token."""
     user_id = get_user_id(req.access_token, req.id_token)
-    ctx_logger = logging.LoggerAdapter(logger, {"session_id": "N/A", "user_id": user_id})
+    _set_log_ctx("N/A", user_id)
     try:
-        ctx_logger.info("🧪 Creating test event")
-        calendar_manager = CalendarManager(access_token=req.access_token)
-        event = calendar_manager.create_test_event()
+        logger.info("🧪 Creating test event")
+        calendar_manager = await _run_gapi(CalendarManager, access_token=req.access_token)
+        event = await _run_gapi(calendar_manager.create_test_event)
+        _invalidate_today_events(req.access_token)
         return {"event": event.model_dump()}
     except Exception as e:
-        ctx_logger.error(f"Failed to create test event: {e}", exc_info=True)
+        logger.error("Failed to create test event: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/calendar/add-events")
-def add_events_to_calendar(req: EventRequest):
-    """Add multiple events to calendar using the provided access token."""
-    user_id = get_user_id(req.access_token, req.id_token)
-    ctx_logger = logging.LoggerAdapter(logger, {"session_id": "N/A", "user_id": user_id})
+async def add_events_to_calendar(request: Request):
+    """Add multiple events to calendar using the provided access token.
+
+    Parses the raw body and validates the event list through the shared
+    TypeAdapter, which goes straight into pydantic-core without building
+    an intermediate request model — noticeable for large payloads.
+    """
+    try:
+        body = json.loads(await request.body())
+        access_token = body.get("access_token")
+        if not access_token:
+            raise HTTPException(status_code=422, detail="access_token is required")
+        events = _event_list_adapter.validate_python(body.get("events", []))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Invalid request body: {e}")
+
+    user_id = get_user_id(access_token, body.get("id_token"))
+    _set_log_ctx("N/A", user_id)
     try:
-        ctx_logger.info(f"➕ Adding {len(req.events)} events to calendar")
-        calendar_manager = CalendarManager(access_token=req.access_token)
-        calendar_manager.add_events_to_calendar(req.events)
-        return {"message": f"Successfully added {len(req.events)} events to calendar"}
+        logger.info("➕ Adding %d events to calendar", len(events))
+        if len(events) <= _CALENDAR_BATCH_SIZE:
+            calendar_manager = await _run_gapi(CalendarManager, access_token=access_token)
+            await _run_gapi(calendar_manager.add_events_to_calendar, events)
+        else:
+            # Shard large payloads into batch-sized chunks and write them
+            # concurrently. Each chunk gets its own CalendarManager because
+            # the underlying httplib2 transport is not thread-safe; the
+            # semaphore keeps us inside Google's per-user rate limits.
+            semaphore = asyncio.Semaphore(_CALENDAR_WRITE_CONCURRENCY)
+
+            def _write_chunk(chunk: List[Event]) -> None:
+                CalendarManager(access_token=access_token).add_events_to_calendar(chunk)
+
+            async def _bounded_write(chunk: List[Event]) -> None:
+                async with semaphore:
+                    await _run_gapi(_write_chunk, chunk)
+
+            chunks = [events[i:i + _CALENDAR_BATCH_SIZE]
+                      for i in range(0, len(events), _CALENDAR_BATCH_SIZE)]
+            await asyncio.gather(*(_bounded_write(chunk) for chunk in chunks))
+        _invalidate_today_events(access_token)
+        return {"message": f"Successfully added {len(events)} events to calendar"}
     except Exception as e:
-        ctx_logger.error(f"Failed to add events to calendar: {e}", exc_info=True)
+        logger.error("Failed to add events to calendar: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/calendar/current-date")
-def get_current_date(req: TokenRequest):
+async def get_current_date(req: TokenRequest):
     """Get current date using the provided access token."""
     user_id = get_user_id(req.access_token, req.id_token)
-    ctx_logger = logging.LoggerAdapter(logger, {"session_id": "N/A", "user_id": user_id})
+    _set_log_ctx("N/A", user_id)
     try:
-        calendar_manager = CalendarManager(access_token=req.access_token)
+        calendar_manager = await _run_gapi(CalendarManager, access_token=req.access_token)
         current_date = calendar_manager.get_current_date()
         return {"current_date": current_date}
     except Exception as e:
-        ctx_logger.error(f"Failed to get current date: {e}", exc_info=True)
+        logger.error("Failed to get current date: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -1,34 +1,54 @@
 import datetime
+import hashlib
 import logging
 from zoneinfo import ZoneInfo
 from typing import List, Optional
 from service_helper import get_service
 from schemas import Event
-from list_today import list_today_events, get_calendar_timezone
+from list_today import list_today_events, get_calendar_timezone, _today_bounds
 from create_event import create_events
-from update_event import update_event
+from update_event import update_events
+
+
+# Calendar timezone per user (keyed by a token digest). A calendar's
+# timezone effectively never changes, so one lookup per user avoids a
+# Google round-trip on every CalendarManager construction.
+_TIMEZONE_CACHE_MAX = 1024
+_timezone_cache: dict = {}
 
 
 class CalendarManager:
     """Manages all calendar operations including reading, writing, and timezone handling."""
-    
+
     def __init__(self, access_token: Optional[str] = None):
         try:
             self.service = get_service(access_token=access_token)
-            self.timezone = ZoneInfo(get_calendar_timezone(service=self.service))
-            logging.info(f"CalendarManager initialized with timezone: {self.timezone}")
+
+            cache_key = None
+            if access_token:
+                cache_key = hashlib.sha256(access_token.encode()).digest()[:16]
+            tz_name = _timezone_cache.get(cache_key) if cache_key else None
+            if tz_name is None:
+                tz_name = get_calendar_timezone(service=self.service)
+                if cache_key:
+                    if len(_timezone_cache) >= _TIMEZONE_CACHE_MAX:
+                        _timezone_cache.clear()
+                    _timezone_cache[cache_key] = tz_name
+
+            self.timezone = ZoneInfo(tz_name)
+            logging.info("CalendarManager initialized with timezone: %s", self.timezone)
         except Exception as e:
-            logging.error(f"Failed to initialize CalendarManager: {e}")
+            logging.error("Failed to initialize CalendarManager: %s", e)
             raise
-    
+
     def get_today_events(self) -> List[Event]:
         """Retrieve all events for today."""
         try:
-            events = list_today_events(service=self.service)
-            logging.info(f"Retrieved {len(events)} events for today")
+            events = list_today_events(service=self.service, timezone=self.timezone)
+            logging.info("Retrieved %d events for today", len(events))
             return events
         except Exception as e:
-            logging.error(f"Failed to get today's events: {e}")
+            logging.error("Failed to get today's events: %s", e)
             raise
     
     def create_test_event(self) -> Event:
@@ -47,74 +67,74 @@ class CalendarManager:
                 already_in_calendar=False
             )
             
-            logging.info(f"Creating test event: {event.summary} at {event.start}")
-            create_events([event], service=self.service)
+            logging.info("Creating test event: %s at %s", event.summary, event.start)
+            create_events([event], service=self.service, timezone=self.timezone)
             logging.info("Test event created successfully")
             return event
         except Exception as e:
-            logging.error(f"Failed to create test event: {e}")
+            logging.error("Failed to create test event: %s", e)
             raise
     
     def add_events_to_calendar(self, events: List[Event]) -> None:
         """Add or update events in the calendar."""
         try:
-            logging.info("=" * 80)
-            logging.info(f"📅 PROCESSING {len(events)} EVENTS FOR CALENDAR:")
+            # Common case: the user previews and commits without changing
+            # anything — nothing to write, so skip the classification loop
+            # and any API calls
+            if not any(not e.already_in_calendar or (e.is_modified and e.event_id)
+                       for e in events):
+                logging.info("✅ Commit: no changes (%d events unchanged)", len(events))
+                return
+
             new_events = []
             updated_events = []
             skipped_events = []
-            
-            for i, event in enumerate(events, 1):
-                logging.info(f"  [{i}] Processing: {event.summary}")
-                logging.info(f"      already_in_calendar: {event.already_in_calendar}")
-                logging.info(f"      is_modified: {event.is_modified}")
-                logging.info(f"      event_id: {event.event_id}")
-                
+
+            # One DEBUG record per event instead of ~9 INFO lines; at INFO
+            # the whole method logs a single summary line.
+            debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+            for event in events:
                 if event.already_in_calendar and event.is_modified and event.event_id:
                     # Update existing event that was moved/modified
-                    logging.info(f"      → ACTION: UPDATE (event was moved)")
-                    logging.info(f"      → Old time: {getattr(event, 'original_start', 'N/A')} → {getattr(event, 'original_end', 'N/A')}")
-                    logging.info(f"      → New time: {event.start} → {event.end}")
-                    update_event(event, service=self.service)
+                    action = "UPDATE"
                     updated_events.append(event)
                 elif not event.already_in_calendar:
                     # Create new event
-                    logging.info(f"      → ACTION: CREATE (new event)")
+                    action = "CREATE"
                     new_events.append(event)
                 else:
                     # If already_in_calendar=True but not modified, skip (unchanged)
-                    logging.info(f"      → ACTION: SKIP (unchanged existing event)")
+                    action = "SKIP"
                     skipped_events.append(event)
-            
-            logging.info("=" * 80)
+
+                if debug:
+                    logging.debug(
+                        "process_event action=%s summary=%r start=%s end=%s in_calendar=%s modified=%s id=%s",
+                        action, event.summary, event.start, event.end,
+                        event.already_in_calendar, event.is_modified, event.event_id
+                    )
+
             if new_events:
-                logging.info(f"🆕 CREATING {len(new_events)} NEW EVENTS:")
-                for event in new_events:
-                    logging.info(f"  - {event.summary} ({event.start} → {event.end})")
-                create_events(new_events, service=self.service)
-            
+                create_events(new_events, service=self.service, timezone=self.timezone)
             if updated_events:
-                logging.info(f"🔄 UPDATED {len(updated_events)} EXISTING EVENTS:")
-                for event in updated_events:
-                    logging.info(f"  - {event.summary} (ID: {event.event_id})")
-            
-            if skipped_events:
-                logging.info(f"⏭️  SKIPPED {len(skipped_events)} UNCHANGED EVENTS:")
-                for event in skipped_events:
-                    logging.info(f"  - {event.summary} (ID: {event.event_id})")
-            
-            logging.info(f"✅ Successfully processed {len(new_events)} new, {len(updated_events)} updated, {len(skipped_events)} skipped")
-            logging.info("=" * 80)
+                update_events(updated_events, service=self.service, timezone=self.timezone)
+
+            logging.info(
+                "✅ Processed %d events: %d new, %d updated, %d skipped",
+                len(events), len(new_events), len(updated_events), len(skipped_events)
+            )
         except Exception as e:
-            logging.error(f"Failed to add/update events in calendar: {e}")
+            logging.error("Failed to add/update events in calendar: %s", e)
             raise
     
     def get_current_date(self) -> str:
         """Get current date in YYYY-MM-DD format."""
         try:
-            current_date = datetime.datetime.now(self.timezone).strftime("%Y-%m-%d")
-            logging.debug(f"Current date: {current_date}")
+            # Reuse the per-timezone day cache; date.isoformat is a C call,
+            # so no strftime format parsing per request
+            current_date = _today_bounds(self.timezone)[0].isoformat()
+            logging.debug("Current date: %s", current_date)
             return current_date
         except Exception as e:
-            logging.error(f"Failed to get current date: {e}")
-            raise 
\ No newline at end of file
+            logging.error("Failed to get current date: %s", e)
+            raise
\ No newline at end of file
@@ -1,6 +1,5 @@
 import argparse
-import datetime
-from service_helper import get_service
+from service_helper import get_service, get_primary_timezone, parse_event_datetime
 from schemas import Event
 from zoneinfo import ZoneInfo
 
@@ -14,43 +13,52 @@ python create_event.py \
   --description "Discuss Q3 roadmap"
 '''
 
-def create_events(events: list[Event], service=None):
+# Google Calendar batch requests accept at most 50 operations each
+BATCH_SIZE = 50
+
+
+def create_events(events: list[Event], service=None, timezone=None):
     if service is None:
         service = get_service()
-    
-    # Get calendar timezone
-    calendar = service.calendars().get(calendarId='primary').execute()
-    timezone = calendar.get('timeZone', 'UTC')
-    tz = ZoneInfo(timezone)
 
+    # Get calendar timezone (cached per service) unless the caller
+    # already knows it
+    if timezone is None:
+        tz = get_primary_timezone(service)
+    else:
+        tz = timezone if isinstance(timezone, ZoneInfo) else ZoneInfo(timezone)
+
+    event_dicts = []
     for event in events:
-        # Parse the datetime and add timezone if missing
-        start_dt = datetime.datetime.fromisoformat(event.start.replace('Z', '+00:00'))
-        end_dt = datetime.datetime.fromisoformat(event.end.replace('Z', '+00:00'))
-        
-        # If no timezone info, assume it's in the calendar's timezone
-        if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=tz)
-        if end_dt.tzinfo is None:
-            end_dt = end_dt.replace(tzinfo=tz)
-        
-        event_dict = {
+        if event.already_in_calendar:
+            print(f"Event {event.summary} is already in the calendar, skipping...")
+            continue
+
+        # Parse the datetime (cached), assuming the calendar's timezone
+        # when the value carries none
+        start_dt = parse_event_datetime(event.start, str(tz))
+        end_dt = parse_event_datetime(event.end, str(tz))
+
+        event_dicts.append({
             'summary':     event.summary,
             'location':    event.location,
             'description': event.description,
             'start':       {'dateTime': start_dt.isoformat()},
             'end':         {'dateTime': end_dt.isoformat()},
-        }
+        })
 
-        if event.already_in_calendar:
-            print(f"Event {event.summary} is already in the calendar, skipping...")
-            continue
+    def _on_created(request_id, response, exception):
+        if exception is not None:
+            raise exception
+        print(f"Event created: {response.get('id')}")
 
-        created = service.events().insert(
-            calendarId='primary',
-            body=event_dict,
-        ).execute()
-        print(f"Event created: {created.get('id')}")
+    # Pipeline inserts into batch requests (one HTTPS round-trip per 50
+    # events) instead of one round-trip per event
+    for i in range(0, len(event_dicts), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_on_created)
+        for event_dict in event_dicts[i:i + BATCH_SIZE]:
+            batch.add(service.events().insert(calendarId='primary', body=event_dict))
+        batch.execute()
 
 
 def create_event(event: Event, service=None):
@@ -15,67 +15,113 @@ def get_calendar_timezone(service=None) -> str:
     calendar = service.calendars().get(calendarId='primary').execute()
     return calendar.get('timeZone', 'UTC')
 
-def list_today_events(service=None) -> list[Event]:
+# Today's ISO bounds per timezone; valid until the date rolls over in
+# that timezone, so the datetime math and isoformat() run once per
+# tz per day instead of on every request
+_day_bounds_cache: dict = {}
+
+
+def _today_bounds(tz: ZoneInfo) -> tuple:
+    """Return (date, iso_start, iso_end) for "today" in the given timezone."""
+    today = datetime.datetime.now(tz).date()
+    cached = _day_bounds_cache.get(str(tz))
+    if cached is not None and cached[0] == today:
+        return cached
+    start_of_day = datetime.datetime.combine(today, datetime.time.min, tzinfo=tz)
+    end_of_day = start_of_day + datetime.timedelta(days=1)
+    bounds = (today, start_of_day.isoformat(), end_of_day.isoformat())
+    _day_bounds_cache[str(tz)] = bounds
+    return bounds
+
+
+def _fmt_hm(iso: str) -> str:
+    """Render hh:mm AM/PM from an ISO-8601 dateTime by string slicing.
+
+    The hour/minute sit at fixed offsets in RFC3339 timestamps, so the
+    debug rendering skips datetime construction and strftime entirely;
+    date-only values fall back to full parsing.
+    """
+    if len(iso) < 16 or iso[10] != 'T':
+        dt = datetime.datetime.fromisoformat(iso.replace('Z', '+00:00'))
+        return dt.strftime('%I:%M %p')
+    h = int(iso[11:13])
+    ampm = 'AM' if h < 12 else 'PM'
+    h = h % 12 or 12
+    return f"{h:02d}:{iso[14:16]} {ampm}"
+
+
+def list_today_events(service=None, timezone=None) -> list[Event]:
     if service is None:
         service = get_service(read_only=True)
 
-    # Get calendar timezone
-    calendar = service.calendars().get(calendarId='primary').execute()
-    timezone = calendar.get('timeZone', 'UTC')
-    
+    # Get calendar timezone unless the caller already knows it
+    # (CalendarManager caches it, saving one round-trip per call)
+    if timezone is None:
+        tz = ZoneInfo(get_calendar_timezone(service=service))
+    else:
+        tz = timezone if isinstance(timezone, ZoneInfo) else ZoneInfo(timezone)
+
     # Define start/end of "today" in the calendar's timezone:
-    
-    tz = ZoneInfo(timezone)
-    now = datetime.datetime.now(tz)
-    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    end_of_day = start_of_day + datetime.timedelta(days=1)
 
-    iso_start = start_of_day.isoformat()
-    iso_end = end_of_day.isoformat()
+    today, iso_start, iso_end = _today_bounds(tz)
 
     logging.info(iso_start)
     logging.info(iso_end)
 
-    events_result = service.events().list(
-        calendarId='primary',
-        timeMin=iso_start,
-        timeMax=iso_end,
-        singleEvents=True,
-        orderBy='startTime'
-    ).execute()
-    events = events_result.get('items', [])
+    # Only request the fields we actually read — without a mask Google
+    # returns ~20 fields per event (attendees, reminders, conferenceData,
+    # ...), all paid for in wire bytes and JSON decode. Paginate instead
+    # of silently stopping at the default 250-event page.
+    events = []
+    page_token = None
+    while True:
+        events_result = service.events().list(
+            calendarId='primary',
+            timeMin=iso_start,
+            timeMax=iso_end,
+            singleEvents=True,
+            orderBy='startTime',
+            maxResults=250,
+            fields='items(id,summary,location,description,'
+                   'start(date,dateTime),end(date,dateTime)),nextPageToken',
+            pageToken=page_token
+        ).execute()
+        events.extend(events_result.get('items', []))
+        page_token = events_result.get('nextPageToken')
+        if not page_token:
+            break
 
     if not events:
         logging.info("No events found for today.")
         return []
 
-    logging.info(f"Events for {start_of_day.date()}:")
+    logging.info("Events for %s:", today)
     results = []
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
     for evt in events:
-        start = evt['start'].get('dateTime', evt['start'].get('date'))
-        end   = evt['end'].get('dateTime',   evt['end'].get('date'))
-        
-        # Parse the datetime strings
-        start_dt = datetime.datetime.fromisoformat(start.replace('Z', '+00:00'))
-        end_dt = datetime.datetime.fromisoformat(end.replace('Z', '+00:00'))
-        
-        # Ensure timezone info is present
-        if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=tz)
-        if end_dt.tzinfo is None:
-            end_dt = end_dt.replace(tzinfo=tz)
-        
-        # Format for logging (human-readable)
-        start_fmt = start_dt.strftime('%I:%M %p')
-        end_fmt = end_dt.strftime('%I:%M %p')
-        logging.info(f" • {evt['summary']} — {start_fmt} to {end_fmt}")
-        
+        start = evt['start'].get('dateTime')
+        end   = evt['end'].get('dateTime')
+
+        if start is None or end is None:
+            # All-day events only carry a date — parse and attach the
+            # calendar's timezone so downstream comparisons work
+            start_dt = datetime.datetime.fromisoformat(evt['start'].get('date')).replace(tzinfo=tz)
+            end_dt = datetime.datetime.fromisoformat(evt['end'].get('date')).replace(tzinfo=tz)
+            start = start_dt.isoformat()
+            end = end_dt.isoformat()
+        elif debug:
+            # Timed events already come back as timezone-aware ISO8601, so
+            # pass the strings straight through; the debug line extracts
+            # hh:mm by slicing instead of datetime + strftime
+            logging.debug(" • %s — %s to %s", evt['summary'],
+                          _fmt_hm(start), _fmt_hm(end))
+
         # Store ISO8601 format for API (consistent with schedule generation)
         # Include event_id so we can track and update events if needed
         results.append(Event(
-            summary=evt['summary'], 
-            start=start_dt.isoformat(), 
-            end=end_dt.isoformat(),
+            summary=evt['summary'],
+            start=start,
+            end=end,
             already_in_calendar=True,
             event_id=evt.get('id'),  # Store Google Calendar event ID
             location=evt.get('location'),
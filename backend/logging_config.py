@@ -1,22 +1,33 @@
+import atexit
 import logging
 import os
 from datetime import datetime
+from logging.handlers import MemoryHandler
 
 
 def setup_logging(log_level: str = "INFO", log_file: str = "llm.log"):
     """Setup logging configuration for the application."""
-    
+
     # Create logs directory if it doesn't exist
     os.makedirs("logs", exist_ok=True)
-    
+
+    # Buffer records in memory and write the file in batches instead of
+    # one syscall per record (per-event loops emit hundreds); ERRORs
+    # flush immediately and a flush is registered for interpreter exit
+    file_handler = logging.FileHandler(f"logs/{log_file}", delay=True)
+    file_handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'))
+    buffered_handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR,
+                                     target=file_handler)
+    atexit.register(buffered_handler.flush)
+
     # Configure logging
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
         handlers=[
             # File handler only - no console output
-            logging.FileHandler(f"logs/{log_file}")
+            buffered_handler
         ]
     )
     
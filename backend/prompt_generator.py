@@ -1,30 +1,68 @@
+import hashlib
+import json
 import logging
+import os
+import time
 from typing import List
 from openai import OpenAI
 from schemas import Event, Task, Schedule, Tasks
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # fall back to exact matching if rapidfuzz is absent
+    fuzz = process = None
 
-class PromptGenerator:
-    """Handles prompt generation and LLM interactions for scheduling."""
-    
-    def __init__(self, client: OpenAI):
-        self.client = client
-        logging.info("PromptGenerator initialized")
-    
-    def generate_scheduling_prompt(self, events: List[Event], tasks: List[Task], current_date: str) -> str:
-        """Generate the prompt for the LLM to create a schedule."""
-        try:
-            prompt = f"""
-You are a helpful assistant that helps me manage my calendar.
-Today is {current_date}.
 
-I have the following {len(events)} events already in my calendar:
-{events}
+# Content-addressed cache for parsed LLM responses, keyed by
+# (model, schema, prompt). Retries and regenerated identical rants hit
+# the cache instead of paying another multi-second LLM round-trip; the
+# prompts embed the current date, so entries naturally stop matching at
+# midnight.
+_RESPONSE_CACHE_TTL = 3600  # seconds
+_RESPONSE_CACHE_MAX = 256
+_response_cache: dict = {}
 
-I have identified the following {len(tasks)} tasks from my rant that I want to schedule:
-{tasks}
+_BAR = "=" * 80
 
-CRITICAL RULES:
+# A task whose name scores at least this against an existing event
+# summary is treated as the same activity
+_DEDUP_SCORE_CUTOFF = 85
+
+
+def _filter_duplicate_tasks(tasks: List[Task], events: List[Event]) -> List[Task]:
+    """Drop tasks already represented by an existing calendar event.
+
+    Fuzzy matching runs in C (rapidfuzz) in microseconds, so there's no
+    reason to pay the LLM to compare "walk dog" against "Walk the dog".
+    Falls back to exact casefolded comparison without rapidfuzz.
+    """
+    if not events or not tasks:
+        return list(tasks)
+    summaries = [e.summary for e in events]
+    if process is not None:
+        kept = [t for t in tasks
+                if process.extractOne(t.name, summaries,
+                                      scorer=fuzz.token_set_ratio,
+                                      score_cutoff=_DEDUP_SCORE_CUTOFF) is None]
+    else:
+        lowered = {s.casefold() for s in summaries}
+        kept = [t for t in tasks if t.name.casefold() not in lowered]
+    if len(kept) != len(tasks):
+        logging.info("🔍 Dropped %d task(s) already covered by existing events",
+                     len(tasks) - len(kept))
+    return kept
+
+
+# Confirmation-style feedback that needs no LLM round-trip
+_NOOP_FEEDBACK = frozenset({
+    "", "ok", "okay", "yes", "no", "confirm", "perfect", "great",
+    "looks good", "lgtm", "sounds good", "no changes",
+})
+
+# Static prompt fragments, built once at import. Only the small varying
+# slots are formatted per call, and the byte-stable rule blocks also give
+# OpenAI's prompt caching a consistent prefix to key on.
+_SCHEDULE_RULES = """CRITICAL RULES:
 1. DEDUPLICATION: Check if any "task" is already represented by an "existing event". For example, if there is a task "walk dog" and an existing event "Walk the dog", they are the same. DO NOT create a new event for it. Instead, just keep or move the existing event.
 2. DO NOT move, delete, or modify existing events unless it's necessary to fit a task or the user explicitly asked.
 3. Schedule new tasks AROUND existing events - find gaps in the schedule.
@@ -34,122 +72,330 @@ CRITICAL RULES:
    - If you move an existing event, set is_modified=True and include original_start/original_end.
    - ALWAYS preserve the event_id for existing events.
 
-Return **only** a JSON object matching the schema.
-            """
-            logging.debug(f"Generated prompt for {len(events)} events and {len(tasks)} tasks")
-            return prompt
-        except Exception as e:
-            logging.error(f"Failed to generate scheduling prompt: {e}")
-            raise
+Return **only** a JSON object matching the schema."""
 
-    def generate_task_prompt(self, rant: str) -> str:
-        """Generate tasks from a rant."""
-        try:
-            prompt = f"""
+_SCHEDULING_PROMPT = """
+You are a helpful assistant that helps me manage my calendar.
+Today is {current_date}.
+
+I have the following {n_events} events already in my calendar:
+{events_json}
+
+I have identified the following {n_tasks} tasks from my rant that I want to schedule:
+{tasks_json}
+
+""" + _SCHEDULE_RULES
+
+_TASK_PROMPT = """
 You are a helpful assistant that helps me manage my calendar.
 I need to convert this rant into a list of tasks:
 {rant}
 
 Return **only** a JSON object matching the schema I provided.
 """
-            logging.debug(f"Generated prompt for {rant}")
-            return prompt
-        except Exception as e:
-            logging.error(f"Failed to generate tasks: {e}")
-            raise
+
+_FUSED_PROMPT = """
+You are a helpful assistant that helps me manage my calendar.
+Today is {current_date}.
+
+I have the following {n_events} events already in my calendar:
+{events_json}
+
+Here is my rant about what I need to get done today:
+{rant}
+
+First, identify the tasks in the rant (with rough time estimates and any
+time-of-day preferences), then schedule them around my existing events.
+
+""" + _SCHEDULE_RULES
+
+_FEEDBACK_PROMPT = """
+You are adjusting a proposed calendar schedule based on user feedback.
+
+CRITICAL RULES:
+1. DEDUPLICATION: If the user feedback implies that a 'new' event (already_in_calendar=False) is actually a modification of an 'existing' event (already_in_calendar=True), MERGE THEM. Keep the existing event's ID and set is_modified=True.
+2. DO NOT create duplicate events for the same activity.
+3. If moving an existing event:
+   - Keep already_in_calendar=True
+   - Keep the original event_id
+   - Set is_modified=True
+   - Provide original_start/original_end
+4. If the user says "move X to 1pm", and X exists as an 'existing' event, change its time. Do not add a new one.
+
+Return only the updated schedule as JSON.
+
+Here is the current proposed schedule:
+{schedule_str}
+
+User Feedback:
+"{feedback}"
+"""
+
+
+class PromptGenerator:
+    """Handles prompt generation and LLM interactions for scheduling."""
+
+    def __init__(self, client: OpenAI,
+                 schedule_model: str = None,
+                 tasks_model: str = None,
+                 feedback_model: str = None):
+        self.client = client
+        # Only the creative scheduling pass needs the larger model; task
+        # extraction and feedback adjustments are structured transforms
+        # where the mini model returns the same JSON much faster
+        self.schedule_model = schedule_model or os.getenv("SCHEDULE_MODEL", "gpt-4.1")
+        self.tasks_model = tasks_model or os.getenv("TASKS_MODEL", "gpt-4.1-mini")
+        self.feedback_model = feedback_model or os.getenv("FEEDBACK_MODEL", "gpt-4.1-mini")
+        logging.info("PromptGenerator initialized (schedule=%s, tasks=%s, feedback=%s)",
+                     self.schedule_model, self.tasks_model, self.feedback_model)
+
+    def _cached_parse(self, model: str, prompt: str, text_format, max_output_tokens: int = None):
+        """Call responses.parse, serving identical requests from a TTL cache.
+
+        max_output_tokens bounds decode steps (callers size it from their
+        input), and the low temperature keeps structured output
+        deterministic — both trim latency on every miss.
+        """
+        key = hashlib.sha256(f"{model}|{text_format.__name__}|{prompt}".encode()).hexdigest()
+        cached = _response_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and cached[0] > now:
+            logging.info("♻️ LLM cache hit for %s", text_format.__name__)
+            return text_format.model_validate_json(cached[1])
+
+        response = self.client.responses.parse(
+            model=model,
+            input=prompt,
+            text_format=text_format,
+            max_output_tokens=max_output_tokens,
+            temperature=0.2
+        )
+        parsed = response.output_parsed
+        if parsed is None and max_output_tokens is not None:
+            # The caller's token cap is sized from an input-length estimate;
+            # when the estimate runs low the output is cut off before the
+            # JSON closes and output_parsed comes back None. Retry once
+            # without the cap instead of crashing on the truncated response.
+            logging.warning("⚠️ %s output truncated at %d tokens; retrying uncapped",
+                            text_format.__name__, max_output_tokens)
+            response = self.client.responses.parse(
+                model=model,
+                input=prompt,
+                text_format=text_format,
+                temperature=0.2
+            )
+            parsed = response.output_parsed
+        if parsed is None:
+            raise ValueError(
+                f"LLM returned no parsable {text_format.__name__} output "
+                f"(status: {getattr(response, 'status', 'unknown')})")
+        if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+            _response_cache.clear()
+        # Store the JSON, not the object, so cache hits hand back a fresh
+        # instance that callers are free to mutate
+        _response_cache[key] = (now + _RESPONSE_CACHE_TTL, parsed.model_dump_json())
+        return parsed
+    
+    @staticmethod
+    def _events_json(events: List[Event]) -> str:
+        """Minified JSON projection of events with only the fields the LLM needs."""
+        return json.dumps(
+            [{"event_id": e.event_id, "summary": e.summary,
+              "start": e.start, "end": e.end} for e in events],
+            separators=(",", ":"))
+
+    def generate_scheduling_prompt(self, events: List[Event], tasks: List[Task], current_date: str) -> str:
+        """Generate the prompt for the LLM to create a schedule."""
+        # Compact JSON projections instead of the verbose __repr__
+        # sentences — only the fields the LLM needs, no repeated field
+        # labels, so the prompt carries far fewer input tokens
+        # Quantize estimates to 5-minute steps — schedules come out on
+        # round boundaries anyway, and the model shouldn't spend attention
+        # on minute-level noise
+        tasks_json = json.dumps(
+            [{"name": t.name, "description": t.description,
+              "minutes": max(5, 5 * round(t.time_estimate / 5)),
+              "preferred_time_of_day": t.preferred_time_of_day} for t in tasks],
+            separators=(",", ":"))
+        logging.debug("Generated prompt for %d events and %d tasks", len(events), len(tasks))
+        return _SCHEDULING_PROMPT.format(
+            current_date=current_date,
+            n_events=len(events),
+            events_json=self._events_json(events),
+            n_tasks=len(tasks),
+            tasks_json=tasks_json)
+
+    def generate_task_prompt(self, rant: str) -> str:
+        """Generate tasks from a rant."""
+        logging.debug("Generated prompt for %r", rant)
+        return _TASK_PROMPT.format(rant=rant)
 
     def generate_tasks(self, rant: str) -> Tasks:
         """Generate tasks from a rant."""
         try:
             prompt = self.generate_task_prompt(rant)
-            response = self.client.responses.parse(
-                model="gpt-4.1",
-                input=prompt,
-                text_format=Tasks
-            )
-            tasks = response.output_parsed
-            logging.info(f"Generated {len(tasks)} tasks")
+            # Rough task-count bound from the rant's clause structure
+            estimated_tasks = rant.count(",") + rant.count(".") + 1
+            tasks = self._cached_parse(self.tasks_model, prompt, Tasks,
+                                       max_output_tokens=min(2048, 64 * estimated_tasks + 256))
+            logging.info("Generated %d tasks", len(tasks))
             return tasks
         except Exception as e:
-            logging.error(f"Failed to generate tasks: {e}")
+            logging.error("Failed to generate tasks: %s", e)
+            raise
+
+    def generate_tasks_batch(self, rants: List[str], poll_interval: int = 30) -> List[Tasks]:
+        """Extract tasks from many rants via the OpenAI Batch API.
+
+        For offline/bulk work (evaluation runs, re-planning backfills)
+        where an hours-long completion window is fine in exchange for ~50%
+        cost and far higher throughput than serial generate_tasks calls.
+        Blocks until the batch finishes; results come back in rant order.
+        """
+        try:
+            lines = []
+            for i, rant in enumerate(rants):
+                lines.append(json.dumps({
+                    "custom_id": f"rant-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.tasks_model,
+                        "messages": [{"role": "user", "content": self.generate_task_prompt(rant)}],
+                        "response_format": {
+                            "type": "json_schema",
+                            "json_schema": {"name": "tasks", "schema": Tasks.model_json_schema()}
+                        }
+                    }
+                }))
+
+            batch_file = self.client.files.create(
+                file=("tasks_batch.jsonl", "\n".join(lines).encode()),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logging.info("📦 Submitted batch %s with %d rants", batch.id, len(rants))
+
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+            if batch.status != "completed":
+                raise RuntimeError(f"Batch {batch.id} finished with status {batch.status}")
+
+            # Output lines are keyed by custom_id, not input order
+            results = {}
+            for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                if not line:
+                    continue
+                item = json.loads(line)
+                content = item["response"]["body"]["choices"][0]["message"]["content"]
+                results[item["custom_id"]] = Tasks.model_validate_json(content)
+            return [results[f"rant-{i}"] for i in range(len(rants))]
+        except Exception as e:
+            logging.error("Failed to generate tasks batch: %s", e)
             raise
 
     def generate_schedule(self, events: List[Event], tasks: List[Task], current_date: str) -> Schedule:
         """Generate a schedule using the LLM."""
         try:
-            logging.info(f"Generating schedule with {len(events)} events and {len(tasks)} tasks")
+            logging.info("Generating schedule with %d events and %d tasks", len(events), len(tasks))
+            # Dedupe in code before spending tokens on tasks the calendar
+            # already covers; the prompt rule stays as a safety net
+            tasks = _filter_duplicate_tasks(tasks, events)
             prompt = self.generate_scheduling_prompt(events, tasks, current_date)
-            
-            response = self.client.responses.parse(
-                model="gpt-4.1",
-                input=prompt,
-                text_format=Schedule
-            )
-            
-            schedule = response.output_parsed
-            logging.info(f"Generated schedule with {len(schedule)} events")
+
+            schedule = self._cached_parse(
+                self.schedule_model, prompt, Schedule,
+                max_output_tokens=min(4096, 120 * (len(events) + len(tasks)) + 512))
+            logging.info("Generated schedule with %d events", len(schedule))
             return schedule
         except Exception as e:
-            logging.error(f"Failed to generate schedule: {e}")
+            logging.error("Failed to generate schedule: %s", e)
             raise 
 
-    def adjust_schedule_with_feedback(self, schedule: Schedule, feedback: str) -> Schedule:
+    def generate_schedule_from_rant(self, rant: str, events: List[Event], current_date: str) -> Schedule:
+        """Generate a schedule directly from a rant in one LLM call.
+
+        Fuses the rant→tasks and tasks→schedule steps: one round-trip
+        instead of two, and the events list is only sent once. The
+        two-step methods stay for debugging and evaluation.
+        """
+        try:
+            logging.info("Generating schedule from rant with %d existing events", len(events))
+            prompt = _FUSED_PROMPT.format(
+                current_date=current_date,
+                n_events=len(events),
+                events_json=self._events_json(events),
+                rant=rant)
+            schedule = self._cached_parse(
+                self.schedule_model, prompt, Schedule,
+                max_output_tokens=min(4096, 120 * len(events) + len(rant) // 2 + 1024))
+            logging.info("Generated schedule with %d events", len(schedule))
+            return schedule
+        except Exception as e:
+            logging.error("Failed to generate schedule from rant: %s", e)
+            raise
+
+    @staticmethod
+    def format_schedule_for_prompt(schedule: Schedule) -> str:
+        """Canonical one-line-per-event rendering of a schedule for prompts.
+
+        Callers that keep a schedule across feedback turns should cache this
+        string and pass it back in, so the prompt prefix stays byte-identical
+        and OpenAI's prompt caching can reuse it.
+        """
+        return "\n".join([
+            f"- {e.summary}: {e.start} → {e.end} "
+            f"(already_in_calendar={e.already_in_calendar}, "
+            f"event_id={e.event_id if e.event_id else 'None'}, "
+            f"is_modified={e.is_modified})"
+            for e in schedule
+        ])
+
+    def adjust_schedule_with_feedback(self, schedule: Schedule, feedback: str,
+                                      schedule_str: str = None) -> Schedule:
         """Adjust the schedule using LLM based on user feedback."""
+        # Short-circuit the common confirmation path — "ok"/"looks good"
+        # means the schedule is already right, so skip the round-trip
+        if feedback.strip().lower().rstrip(".!") in _NOOP_FEEDBACK:
+            logging.info("👍 No-op feedback %r; returning schedule unchanged", feedback)
+            return schedule
         try:
             # Format schedule for prompt with all relevant details
-            schedule_str = "\n".join([
-                f"- {e.summary}: {e.start} → {e.end} "
-                f"(already_in_calendar={e.already_in_calendar}, "
-                f"event_id={e.event_id if e.event_id else 'None'}, "
-                f"is_modified={getattr(e, 'is_modified', False)})"
-                for e in schedule
-            ])
-            
-            prompt = f"""
-Here is the current proposed schedule:
-{schedule_str}
+            if schedule_str is None:
+                schedule_str = self.format_schedule_for_prompt(schedule)
 
-User Feedback:
-"{feedback}"
-
-CRITICAL RULES:
-1. DEDUPLICATION: If the user feedback implies that a 'new' event (already_in_calendar=False) is actually a modification of an 'existing' event (already_in_calendar=True), MERGE THEM. Keep the existing event's ID and set is_modified=True.
-2. DO NOT create duplicate events for the same activity.
-3. If moving an existing event:
-   - Keep already_in_calendar=True
-   - Keep the original event_id
-   - Set is_modified=True
-   - Provide original_start/original_end
-4. If the user says "move X to 1pm", and X exists as an 'existing' event, change its time. Do not add a new one.
+            # The constant rules and the (stable) schedule rendering come
+            # first and only the feedback suffix changes between turns, so
+            # repeated adjustments share a cacheable prompt prefix.
+            prompt = _FEEDBACK_PROMPT.format(schedule_str=schedule_str, feedback=feedback)
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(_BAR)
+                logging.debug("📤 SENDING PROMPT TO LLM:")
+                logging.debug(prompt)
+                logging.debug(_BAR)
 
-Return only the updated schedule as JSON.
-"""
-            logging.info("=" * 80)
-            logging.info("📤 SENDING PROMPT TO LLM:")
-            logging.info(prompt)
-            logging.info("=" * 80)
-            
-            response = self.client.responses.parse(
-                model="gpt-4.1",
-                input=prompt,
-                text_format=Schedule
-            )
-            adjusted_schedule = response.output_parsed
-            
-            logging.info("=" * 80)
-            logging.info(f"📥 LLM RETURNED {len(adjusted_schedule)} EVENTS:")
-            for i, event in enumerate(adjusted_schedule, 1):
-                logging.info(f"  [{i}] {event.summary}")
-                logging.info(f"      start: {event.start}, end: {event.end}")
-                logging.info(f"      already_in_calendar: {event.already_in_calendar}")
-                logging.info(f"      event_id: {event.event_id}")
-                logging.info(f"      is_modified: {getattr(event, 'is_modified', 'NOT SET')}")
-                if hasattr(event, 'original_start') and event.original_start:
-                    logging.info(f"      original_start: {event.original_start}")
-                    logging.info(f"      original_end: {event.original_end}")
-            logging.info("=" * 80)
+            adjusted_schedule = self._cached_parse(
+                self.feedback_model, prompt, Schedule,
+                max_output_tokens=min(4096, 120 * len(schedule) + 512))
             
+            logging.info("📥 LLM returned %d events", len(adjusted_schedule))
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                for i, event in enumerate(adjusted_schedule, 1):
+                    logging.debug("  [%d] %s", i, event.summary)
+                    logging.debug("      start: %s, end: %s", event.start, event.end)
+                    logging.debug("      already_in_calendar: %s", event.already_in_calendar)
+                    logging.debug("      event_id: %s", event.event_id)
+                    logging.debug("      is_modified: %s", event.is_modified)
+                    if event.original_start:
+                        logging.debug("      original_start: %s", event.original_start)
+                        logging.debug("      original_end: %s", event.original_end)
+
             return adjusted_schedule
         except Exception as e:
-            logging.error(f"Failed to adjust schedule with feedback: {e}")
+            logging.error("Failed to adjust schedule with feedback: %s", e)
             raise 
\ No newline at end of file
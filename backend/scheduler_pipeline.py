@@ -5,6 +5,14 @@ from prompt_generator import PromptGenerator
 from schemas import Task, Schedule
 
 
+# Acknowledgements that mean "accept the schedule" — end the feedback
+# loop instead of paying an LLM round-trip to be told nothing changed
+_ACCEPT_FEEDBACK = frozenset({
+    "ok", "okay", "good", "looks good", "lgtm", "great", "perfect",
+    "no", "n", "nope", "nothing", "none", "done", "thanks", "thank you",
+})
+
+
 class SchedulerPipeline:
     """Orchestrates the entire scheduling pipeline."""
     
@@ -72,15 +80,33 @@ class SchedulerPipeline:
         """Generate schedule using LLM."""
         current_date = self.calendar_manager.get_current_date()
         schedule = self.prompt_generator.generate_schedule(events, tasks, current_date)
-        
-        # Track which existing events were modified
-        existing_event_map = {e.summary: e for e in events if e.already_in_calendar}
-        
+        return self._reconcile_schedule(events, schedule)
+
+    def _generate_schedule_from_rant(self, events: List, rant: str) -> Schedule:
+        """Generate schedule straight from the rant with one fused LLM call."""
+        current_date = self.calendar_manager.get_current_date()
+        schedule = self.prompt_generator.generate_schedule_from_rant(rant, events, current_date)
+        return self._reconcile_schedule(events, schedule)
+
+    def _reconcile_schedule(self, events: List, schedule: Schedule) -> Schedule:
+        """Restore event ids and mark moved events on an LLM-produced schedule."""
+        # Track which existing events were modified. One combined index keyed
+        # by both event_id and casefolded summary, so the loop below does a
+        # single lookup per event (the LLM sometimes drops the id but keeps
+        # the summary).
+        existing_index = {}
+        for e in events:
+            if not e.already_in_calendar:
+                continue
+            if e.event_id:
+                existing_index[("id", e.event_id)] = e
+            existing_index[("name", e.summary.casefold())] = e
+
         for event in schedule:
             if event.already_in_calendar:
-                # Check if this existing event was moved
-                if event.summary in existing_event_map:
-                    original = existing_event_map[event.summary]
+                original = (existing_index.get(("id", event.event_id))
+                            or existing_index.get(("name", event.summary.casefold())))
+                if original is not None:
                     # Compare times to detect if moved
                     if event.start != original.start or event.end != original.end:
                         event.is_modified = True
@@ -111,12 +137,22 @@ class SchedulerPipeline:
                 if event.description:
                     print(f"    Description: {event.description}")
             feedback = input("\nWould you like to make any changes? (Describe in plain English, or press Enter to accept): ")
-            if not feedback.strip():
+            if feedback.strip().lower().rstrip(".!") in _ACCEPT_FEEDBACK or not feedback.strip():
                 break
             schedule = self.prompt_generator.adjust_schedule_with_feedback(schedule, feedback)
         return schedule
     
     def _add_events_to_calendar(self, schedule: Schedule) -> None:
         """Add generated events to calendar."""
-        # TODO: Filter out events that are already in calendar
-        self.calendar_manager.add_events_to_calendar(schedule) 
\ No newline at end of file
+        # CalendarManager already skips unchanged existing events; here we
+        # also drop "new" events that exactly match an existing one — an
+        # LLM misclassification that would otherwise create a duplicate
+        existing_keys = {(e.summary.casefold(), e.start, e.end)
+                         for e in schedule if e.already_in_calendar}
+        to_commit = [e for e in schedule
+                     if e.already_in_calendar
+                     or (e.summary.casefold(), e.start, e.end) not in existing_keys]
+        dropped = len(schedule) - len(to_commit)
+        if dropped:
+            logging.info("Dropped %d duplicate event(s) before commit", dropped)
+        self.calendar_manager.add_events_to_calendar(to_commit)
\ No newline at end of file
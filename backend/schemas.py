@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from typing import Optional
 
 class Event(BaseModel):
@@ -6,6 +6,10 @@ class Event(BaseModel):
     An event is a single item that is in a calendar,
     or a single item that I want to add to a calendar.
     '''
+    # Build the validation schema lazily on first use instead of at
+    # import time, so CLI entry points that never validate skip it
+    model_config = ConfigDict(defer_build=True)
+
     summary: str
     start: str
     end: str
@@ -29,17 +33,26 @@ class Task(BaseModel):
     It has a name, a description, and an amount of time it will take,
     and an optional preference for what time of day it should be completed.
     '''
+    model_config = ConfigDict(defer_build=True)
+
     name: str
-    description: str
+    description: str = Field(description="Short description, 15 words or fewer")
     time_estimate: int
     preferred_time_of_day: Optional[str] = None
 
+    # Formatted once at construction — the fields never change after
+    # parsing, so repeated print(task) calls reuse the same string
+    _str: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context) -> None:
+        parts = [f"Name: '{self.name}' Description: '{self.description}' Time Estimate: {self.time_estimate} minutes."]
+        if self.preferred_time_of_day:
+            parts.append(f" Ideally, I would like to do this task at {self.preferred_time_of_day}.")
+        self._str = "".join(parts)
+
     # to do print(task)
     def __str__(self):
-        base = f"Name: '{self.name}' Description: '{self.description}' Time Estimate: {self.time_estimate} minutes."
-        if self.preferred_time_of_day:
-            base += f" Ideally, I would like to do this task at {self.preferred_time_of_day}."
-        return base
+        return self._str
     
     # to do print(tasks)
     def __repr__(self):
@@ -49,6 +62,8 @@ class Schedule(BaseModel):
     '''
     A schedule is a list of events.
     '''
+    model_config = ConfigDict(defer_build=True)
+
     events: list[Event]
 
     def __str__(self):
@@ -70,6 +85,8 @@ class Tasks(BaseModel):
     '''
     A list of tasks.
     '''
+    model_config = ConfigDict(defer_build=True)
+
     tasks: list[Task]
 
     def __str__(self):
@@ -1,37 +1,115 @@
+import datetime
+import functools
+import json
 import os
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+import weakref
+from zoneinfo import ZoneInfo
+
+# The google client stack (googleapiclient, oauthlib, httplib2) costs a
+# few hundred ms to import, so pull it in lazily: entry points that
+# never touch Calendar — e.g. the pure-LLM tests — skip it entirely.
 
 
 # If you modify scopes, delete token.json.
 READ_ONLY_SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
 ALL_SCOPES = ['https://www.googleapis.com/auth/calendar.events', 'https://www.googleapis.com/auth/calendar.readonly']
 
+# Parsed Calendar v3 discovery document, loaded once per process. build()
+# re-reads and re-parses the ~100 KB discovery JSON on every call; caching
+# the dict leaves only the cheap Resource wiring per service.
+_discovery_doc = None
+
+
+def _calendar_discovery_doc():
+    global _discovery_doc
+    if _discovery_doc is None:
+        from googleapiclient.discovery_cache import get_static_doc
+        raw = get_static_doc('calendar', 'v3')
+        if raw is not None:
+            _discovery_doc = json.loads(raw)
+    return _discovery_doc
+
+@functools.lru_cache(maxsize=4096)
+def parse_event_datetime(value: str, tz_key: str) -> datetime.datetime:
+    """Parse an event timestamp, attaching tz_key if the value is naive.
+
+    Cached: schedules repeat the same timestamps across regenerations and
+    commits, so each distinct string is parsed once. datetimes are
+    immutable, making the shared instances safe.
+    """
+    dt = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=ZoneInfo(tz_key))
+    return dt
+
+
+# Primary-calendar timezone per service object. A calendar's timezone
+# effectively never changes, so each service pays the lookup round-trip
+# at most once; weak keys let entries die with their service.
+_primary_tz_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_primary_timezone(service) -> ZoneInfo:
+    """Return the primary calendar's timezone, cached per service."""
+    tz = _primary_tz_cache.get(service)
+    if tz is None:
+        calendar = service.calendars().get(calendarId='primary').execute()
+        tz = ZoneInfo(calendar.get('timeZone', 'UTC'))
+        _primary_tz_cache[service] = tz
+    return tz
+
+
+# Default (token.json) services, built once per process so the CLI
+# scripts reuse one service — and its underlying HTTPS connections —
+# across calls. Token-bound services stay per-request since every
+# request may carry a different token.
+_default_services: dict = {}
+
+
 def get_service(read_only=False, access_token=None):
+    from google.oauth2.credentials import Credentials
+
     creds = None
     # SCOPES = READ_ONLY_SCOPES if read_only else ALL_SCOPES
     SCOPES = ALL_SCOPES
-    
+
     if access_token:
         # Use the provided access token
         creds = Credentials(token=access_token, scopes=SCOPES)
-    else:
-        # Load existing credentials if available (fallback to file-based approach)
-        if os.path.exists('token.json'):
-            creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-        
-        # If no valid credentials available, let the user log in
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    'credentials.json', SCOPES)
-                creds = flow.run_local_server(port=0)
-            # Save the credentials for the next run
-            with open('token.json', 'w') as f:
-                f.write(creds.to_json())
-    
+        return _build_service(creds)
+
+    cached = _default_services.get(read_only)
+    if cached is not None:
+        return cached
+
+    # Load existing credentials if available (fallback to file-based approach)
+    if os.path.exists('token.json'):
+        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+
+    # If no valid credentials available, let the user log in
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            from google.auth.transport.requests import Request
+            creds.refresh(Request())
+        else:
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            flow = InstalledAppFlow.from_client_secrets_file(
+                'credentials.json', SCOPES)
+            creds = flow.run_local_server(port=0)
+        # Save the credentials for the next run
+        with open('token.json', 'w') as f:
+            f.write(creds.to_json())
+
+    service = _build_service(creds)
+    _default_services[read_only] = service
+    return service
+
+
+def _build_service(creds):
+    from googleapiclient.discovery import build, build_from_document
+
+    discovery_doc = _calendar_discovery_doc()
+    if discovery_doc is not None:
+        return build_from_document(discovery_doc, credentials=creds)
+    # Fallback if no static discovery document is bundled
     return build('calendar', 'v3', credentials=creds)
\ No newline at end of file
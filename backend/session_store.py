@@ -0,0 +1,115 @@
+import logging
+import os
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson is in requirements
+    import json as _json
+
+
+SESSION_TTL_SECONDS = 3600
+
+# Hard cap on in-memory sessions: with JSON-only payloads a session is a few
+# KB, so this bounds the fallback store to tens of MB worst-case.
+MAX_LOCAL_SESSIONS = 10000
+
+
+class SessionStore:
+    """Stores schedule sessions as JSON-serializable payloads.
+
+    When REDIS_URL is set, sessions live in Redis under `sched:{id}` with a
+    TTL, so multiple workers can share them and expiry is handled by Redis.
+    Without Redis the store falls back to an in-process dict with the same
+    interface, and expired sessions are swept on write.
+
+    Payloads must stay JSON-serializable (schedule as event dicts, tokens,
+    ISO timestamps) — live objects like CalendarManager are rebuilt from the
+    stored access token on demand.
+    """
+
+    def __init__(self, ttl_seconds: int = SESSION_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._redis = None
+        self._local: Dict[str, Dict] = {}
+        # Expiry deadline per local session, refreshed on every set() so
+        # the fallback matches the Redis path's ex= semantics
+        self._local_expiry: Dict[str, float] = {}
+
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                import redis
+                self._redis = redis.Redis.from_url(redis_url, decode_responses=True)
+                self._redis.ping()
+                # Log the host only — REDIS_URL routinely embeds credentials
+                logging.info("SessionStore using Redis at %s",
+                             urlparse(redis_url).hostname or "localhost")
+            except Exception as e:
+                logging.warning("Failed to connect to Redis (%s), falling back to in-memory sessions", e)
+                self._redis = None
+
+        if self._redis is None:
+            logging.info("SessionStore using in-memory storage")
+
+    def _key(self, session_id: str) -> str:
+        return f"sched:{session_id}"
+
+    def set(self, session_id: str, payload: Dict) -> None:
+        """Create or update a session, refreshing its TTL."""
+        if self._redis is not None:
+            self._redis.set(self._key(session_id), _json.dumps(payload), ex=self.ttl_seconds)
+        else:
+            self._cleanup_expired()
+            # Re-insert so dict order keeps tracking expiry order, and
+            # refresh the deadline to match the Redis path's ex=
+            self._local.pop(session_id, None)
+            self._local[session_id] = payload
+            self._local_expiry[session_id] = time.monotonic() + self.ttl_seconds
+            # Evict oldest sessions if we're over the cap (insertion order
+            # tracks expiry order)
+            while len(self._local) > MAX_LOCAL_SESSIONS:
+                self._drop_local(next(iter(self._local)))
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        """Return the session payload, or None if missing/expired."""
+        if self._redis is not None:
+            raw = self._redis.get(self._key(session_id))
+            return _json.loads(raw) if raw else None
+
+        session = self._local.get(session_id)
+        if session is None:
+            return None
+        if self._is_expired(session_id):
+            self._drop_local(session_id)
+            return None
+        return session
+
+    def delete(self, session_id: str) -> None:
+        """Remove a session (no-op if it doesn't exist)."""
+        if self._redis is not None:
+            self._redis.delete(self._key(session_id))
+        else:
+            self._drop_local(session_id)
+
+    def _drop_local(self, session_id: str) -> None:
+        self._local.pop(session_id, None)
+        self._local_expiry.pop(session_id, None)
+
+    def _is_expired(self, session_id: str) -> bool:
+        return self._local_expiry.get(session_id, 0.0) <= time.monotonic()
+
+    def _cleanup_expired(self) -> None:
+        """Remove expired sessions from the in-memory fallback.
+
+        set() re-inserts refreshed sessions at the end, so dict order
+        tracks expiry order and popping from the front until the head is
+        still fresh is O(expired) instead of a full scan.
+        """
+        while self._local:
+            oldest_id = next(iter(self._local))
+            if not self._is_expired(oldest_id):
+                break
+            self._drop_local(oldest_id)
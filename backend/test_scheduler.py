@@ -1,4 +1,6 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from openai import OpenAI
 from calendar_manager import CalendarManager
 from prompt_generator import PromptGenerator
@@ -6,9 +8,40 @@ from scheduler_pipeline import SchedulerPipeline
 from schemas import Task, Schedule
 
 
+logger = logging.getLogger(__name__)
+
+
+# Warm fixtures shared across tests: OpenAI() builds an HTTP client and
+# CalendarManager authenticates against Google, so construct each once
+# per process instead of per test. RLock since the getters nest.
+_fixture_lock = threading.RLock()
+_fixtures: dict = {}
+
+
+def get_test_client() -> OpenAI:
+    with _fixture_lock:
+        if "client" not in _fixtures:
+            _fixtures["client"] = OpenAI()
+        return _fixtures["client"]
+
+
+def get_test_calendar_manager() -> CalendarManager:
+    with _fixture_lock:
+        if "calendar_manager" not in _fixtures:
+            _fixtures["calendar_manager"] = CalendarManager()
+        return _fixtures["calendar_manager"]
+
+
+def get_test_prompt_generator() -> PromptGenerator:
+    with _fixture_lock:
+        if "prompt_generator" not in _fixtures:
+            _fixtures["prompt_generator"] = PromptGenerator(get_test_client())
+        return _fixtures["prompt_generator"]
+
+
 def test_llm_basic():
     """Test basic LLM functionality."""
-    client = OpenAI()
+    client = get_test_client()
     response = client.responses.create(
         model="gpt-4.1",
         input="Write a one-sentence bedtime story about a unicorn."
@@ -19,9 +52,8 @@ def test_llm_basic():
 
 def test_schema_parsing():
     """Test schema parsing with a predefined prompt."""
-    client = OpenAI()
-    prompt_generator = PromptGenerator(client)
-    
+    prompt_generator = get_test_prompt_generator()
+
     # Mock data for testing
     mock_events = [
         "test 2 from 12:30 PM to 01:30 PM", 
@@ -40,15 +72,15 @@ def test_schema_parsing():
             print(f"  {event.summary}: {event.start} to {event.end}")
         return schedule
     except Exception as e:
-        logging.error(f"Schema parsing test failed: {e}")
+        logger.error(f"Schema parsing test failed: {e}")
         raise
 
 
 def test_calendar_operations():
     """Test calendar operations without creating real events."""
     try:
-        calendar_manager = CalendarManager()
-        
+        calendar_manager = get_test_calendar_manager()
+
         # Test getting current date
         current_date = calendar_manager.get_current_date()
         print(f"Current date: {current_date}")
@@ -59,18 +91,16 @@ def test_calendar_operations():
         
         return events
     except Exception as e:
-        logging.error(f"Calendar operations test failed: {e}")
+        logger.error(f"Calendar operations test failed: {e}")
         raise
 
 
 def test_pipeline_non_interactive():
     """Test the full pipeline in non-interactive mode."""
     try:
-        # Initialize components
-        calendar_manager = CalendarManager()
-        client = OpenAI()
-        prompt_generator = PromptGenerator(client)
-        pipeline = SchedulerPipeline(calendar_manager, prompt_generator)
+        # Initialize components from the shared fixtures
+        pipeline = SchedulerPipeline(get_test_calendar_manager(),
+                                     get_test_prompt_generator())
         
         # Test tasks
         tasks = [
@@ -84,41 +114,61 @@ def test_pipeline_non_interactive():
         return schedule
         
     except Exception as e:
-        logging.error(f"Pipeline test failed: {e}")
+        logger.error(f"Pipeline test failed: {e}")
         raise
 
 
 def run_all_tests():
     """Run all tests and report results."""
-    test_results = {}
-    
-    tests = [
+    test_results = []
+
+    def _record(test_name, get_result):
+        # Run (or collect) first so the "Finished" banner really marks
+        # completion — for the serial tests get_result executes the test
+        try:
+            result = get_result()
+            outcome = (test_name, "PASS", result)
+        except Exception as e:
+            outcome = (test_name, "FAIL", str(e))
+            logger.error(f"Test {test_name} failed: {e}")
+        test_results.append(outcome)
+        print(f"\n{'='*50}")
+        print(f"Finished {test_name} test")
+        print(f"{'='*50}")
+        if outcome[1] == "PASS":
+            print(f"✅ {test_name}: PASSED")
+        else:
+            print(f"❌ {test_name}: FAILED - {outcome[2]}")
+
+    llm_tests = [
         ("LLM Basic", test_llm_basic),
-        ("Calendar Operations", test_calendar_operations),
         ("Schema Parsing", test_schema_parsing),
+    ]
+    calendar_tests = [
+        ("Calendar Operations", test_calendar_operations),
         ("Pipeline Non-Interactive", test_pipeline_non_interactive),
     ]
-    
-    for test_name, test_func in tests:
-        try:
-            print(f"\n{'='*50}")
-            print(f"Running {test_name} test...")
-            print(f"{'='*50}")
-            
-            result = test_func()
-            test_results[test_name] = ("PASS", result)
-            print(f"✅ {test_name}: PASSED")
-            
-        except Exception as e:
-            test_results[test_name] = ("FAIL", str(e))
-            print(f"❌ {test_name}: FAILED - {e}")
-            logging.error(f"Test {test_name} failed: {e}")
+
+    # The OpenAI-only tests overlap their HTTP waits in a thread pool
+    # (the shared client's httpx pool is thread-safe). The calendar
+    # tests run serially afterwards: they go through one shared
+    # googleapiclient service whose httplib2 transport is NOT
+    # thread-safe — the same constraint app.py works around by building
+    # a CalendarManager per request.
+    with ThreadPoolExecutor(max_workers=len(llm_tests)) as executor:
+        futures = {executor.submit(test_func): test_name
+                   for test_name, test_func in llm_tests}
+        for future in as_completed(futures):
+            _record(futures[future], future.result)
+
+    for test_name, test_func in calendar_tests:
+        _record(test_name, test_func)
     
     # Summary
     print(f"\n{'='*50}")
     print("TEST SUMMARY")
     print(f"{'='*50}")
-    passed = sum(1 for status, _ in test_results.values() if status == "PASS")
+    passed = sum(1 for _, status, _ in test_results if status == "PASS")
     total = len(test_results)
     print(f"Passed: {passed}/{total}")
     
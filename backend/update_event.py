@@ -1,8 +1,57 @@
-import datetime
-from service_helper import get_service
+from service_helper import get_service, get_primary_timezone, parse_event_datetime
 from schemas import Event
 from zoneinfo import ZoneInfo
 
+# Google Calendar batch requests accept at most 50 operations each
+BATCH_SIZE = 50
+
+
+def update_events(events: list[Event], service=None, timezone=None):
+    """Batch-update moved events via events().patch in as few round-trips as possible."""
+    if service is None:
+        service = get_service()
+
+    events = [e for e in events if e.event_id]
+    if not events:
+        return
+
+    # Get calendar timezone (cached per service) unless the caller
+    # already knows it
+    if timezone is None:
+        tz = get_primary_timezone(service)
+    else:
+        tz = timezone if isinstance(timezone, ZoneInfo) else ZoneInfo(timezone)
+
+    def _on_updated(request_id, response, exception):
+        if exception is not None:
+            raise exception
+        print(f"Event updated: {response.get('summary')} (ID: {response.get('id')})")
+
+    for i in range(0, len(events), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_on_updated)
+        for event in events[i:i + BATCH_SIZE]:
+            start_dt = parse_event_datetime(event.start, str(tz))
+            end_dt = parse_event_datetime(event.end, str(tz))
+
+            # patch only sends the changed fields, so no events().get first
+            patch_body = {
+                'summary': event.summary,
+                'start': {'dateTime': start_dt.isoformat()},
+                'end': {'dateTime': end_dt.isoformat()},
+            }
+            if event.location:
+                patch_body['location'] = event.location
+            if event.description:
+                patch_body['description'] = event.description
+
+            batch.add(service.events().patch(
+                calendarId='primary',
+                eventId=event.event_id,
+                body=patch_body
+            ))
+        batch.execute()
+
+
 def update_event(event: Event, service=None):
     """Update an existing calendar event."""
     if service is None:
@@ -11,42 +60,31 @@ def update_event(event: Event, service=None):
     if not event.event_id:
         raise ValueError("Cannot update event without event_id")
     
-    # Get calendar timezone
-    calendar = service.calendars().get(calendarId='primary').execute()
-    timezone = calendar.get('timeZone', 'UTC')
-    tz = ZoneInfo(timezone)
-    
-    # Parse the datetime and add timezone if missing
-    start_dt = datetime.datetime.fromisoformat(event.start.replace('Z', '+00:00'))
-    end_dt = datetime.datetime.fromisoformat(event.end.replace('Z', '+00:00'))
-    
-    # If no timezone info, assume it's in the calendar's timezone
-    if start_dt.tzinfo is None:
-        start_dt = start_dt.replace(tzinfo=tz)
-    if end_dt.tzinfo is None:
-        end_dt = end_dt.replace(tzinfo=tz)
-    
-    # Get the existing event first
-    existing_event = service.events().get(
-        calendarId='primary',
-        eventId=event.event_id
-    ).execute()
+    # Get calendar timezone (cached per service)
+    tz = get_primary_timezone(service)
     
-    # Update the event
-    existing_event['summary'] = event.summary
-    existing_event['start'] = {'dateTime': start_dt.isoformat()}
-    existing_event['end'] = {'dateTime': end_dt.isoformat()}
+    # Parse the datetime (cached), assuming the calendar's timezone when
+    # the value carries none
+    start_dt = parse_event_datetime(event.start, str(tz))
+    end_dt = parse_event_datetime(event.end, str(tz))
     
+    # patch only sends the changed fields and preserves the rest
+    # server-side, so no events().get round-trip first
+    patch_body = {
+        'summary': event.summary,
+        'start': {'dateTime': start_dt.isoformat()},
+        'end': {'dateTime': end_dt.isoformat()},
+    }
     if event.location:
-        existing_event['location'] = event.location
+        patch_body['location'] = event.location
     if event.description:
-        existing_event['description'] = event.description
-    
-    updated = service.events().update(
+        patch_body['description'] = event.description
+
+    updated = service.events().patch(
         calendarId='primary',
         eventId=event.event_id,
-        body=existing_event
+        body=patch_body
     ).execute()
-    
+
     print(f"Event updated: {updated.get('summary')} (ID: {updated.get('id')})")
     return updated
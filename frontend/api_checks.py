@@ -1,5 +1,9 @@
 import requests
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
@@ -7,34 +11,59 @@ from google.auth.transport.requests import Request
 # Google OAuth2 scopes for Calendar
 SCOPES = ['https://www.googleapis.com/auth/calendar.events', 'https://www.googleapis.com/auth/calendar.readonly']
 
+# Credentials cached in memory so repeated calls skip the token.json
+# disk read; the lock serializes refreshes so concurrent callers can't
+# race each other into duplicate refresh round-trips.
+_CREDS = None
+_CREDS_LOCK = threading.Lock()
+
 def get_access_token():
     # This assumes you have a credentials.json in your frontend/ directory
-    creds = None
-    if os.path.exists('token.json'):
-        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0)
-        # Save the credentials for the next run
-        with open('token.json', 'w') as token:
-            token.write(creds.to_json())
-    return creds.token
+    global _CREDS
+    with _CREDS_LOCK:
+        if _CREDS and _CREDS.valid:
+            return _CREDS.token
+        creds = None
+        if os.path.exists('token.json'):
+            creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    'credentials.json', SCOPES)
+                creds = flow.run_local_server(port=0)
+            # Save the credentials for the next run
+            with open('token.json', 'w') as token:
+                token.write(creds.to_json())
+        _CREDS = creds
+        return creds.token
 
 BACKEND_URL = "http://localhost:8000"
 
+# One pooled session for every check: connections to the backend are
+# kept alive instead of paying a TCP handshake per call. Transient
+# 429/5xx responses are retried with backoff on GETs only — the POSTs
+# (schedule generation, feedback, /schedule/commit) are not safe to
+# replay, so they get no automatic retries.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=frozenset({"GET"}))
+))
+
 def test_health():
     """Test the basic health endpoint."""
-    resp = requests.get(f"{BACKEND_URL}/health")
+    resp = _SESSION.get(f"{BACKEND_URL}/health")
     print("Health check status code:", resp.status_code)
     print("Health check response:", resp.json())
 
 def test_get_today_events(access_token):
     """Test getting today's events using the token."""
-    resp = requests.post(f"{BACKEND_URL}/calendar/today", 
+    resp = _SESSION.post(f"{BACKEND_URL}/calendar/today", 
                         json={"access_token": access_token})
     print("Get today's events status code:", resp.status_code)
     if resp.status_code == 200:
@@ -47,7 +76,7 @@ def test_get_today_events(access_token):
 
 def test_get_current_date(access_token):
     """Test getting current date using the token."""
-    resp = requests.post(f"{BACKEND_URL}/calendar/current-date", 
+    resp = _SESSION.post(f"{BACKEND_URL}/calendar/current-date", 
                         json={"access_token": access_token})
     print("Get current date status code:", resp.status_code)
     if resp.status_code == 200:
@@ -58,7 +87,7 @@ def test_get_current_date(access_token):
 
 def test_create_test_event(access_token):
     """Test creating a test event using the token."""
-    resp = requests.post(f"{BACKEND_URL}/calendar/test-event", 
+    resp = _SESSION.post(f"{BACKEND_URL}/calendar/test-event", 
                         json={"access_token": access_token})
     print("Create test event status code:", resp.status_code)
     if resp.status_code == 200:
@@ -73,7 +102,7 @@ def test_interactive_scheduling(access_token):
     
     # Step 1: Generate initial schedule
     print("1. Generating initial schedule...")
-    resp = requests.post(f"{BACKEND_URL}/schedule/generate", 
+    resp = _SESSION.post(f"{BACKEND_URL}/schedule/generate", 
                         json={
                             "access_token": access_token,
                             "rant": "I need to write a blog post about AI scheduling, attend a launch review meeting, and walk my dog. I have a busy day ahead!"
@@ -92,7 +121,7 @@ def test_interactive_scheduling(access_token):
     
     # Step 2: Provide feedback
     print("\n2. Providing feedback...")
-    resp = requests.post(f"{BACKEND_URL}/schedule/feedback", 
+    resp = _SESSION.post(f"{BACKEND_URL}/schedule/feedback", 
                         json={
                             "access_token": access_token,
                             "schedule_id": schedule_id,
@@ -110,7 +139,7 @@ def test_interactive_scheduling(access_token):
     
     # Step 3: Get current schedule
     print("\n3. Getting current schedule...")
-    resp = requests.get(f"{BACKEND_URL}/schedule/{schedule_id}?access_token={access_token}")
+    resp = _SESSION.get(f"{BACKEND_URL}/schedule/{schedule_id}?access_token={access_token}")
     
     if resp.status_code == 200:
         result = resp.json()
@@ -123,13 +152,14 @@ def test_interactive_scheduling(access_token):
     print("(Uncomment the code below to actually commit events to calendar)")
     
     # Uncomment these lines to actually commit the schedule:
-    resp = requests.post(f"{BACKEND_URL}/schedule/commit", 
+    resp = _SESSION.post(f"{BACKEND_URL}/schedule/commit",
                         json={
                             "access_token": access_token,
                             "schedule_id": schedule_id
                         })
-    if resp.status_code == 200:
-        print("Successfully committed schedule to calendar!")
+    # Commit is async: the backend returns 202 and writes in the background
+    if resp.status_code in (200, 202):
+        print("Commit accepted:", resp.json().get("message"))
     else:
         print("Error committing schedule:", resp.json())
 
@@ -137,18 +167,21 @@ if __name__ == "__main__":
     access_token = get_access_token()
     print("Got access token:", access_token[:10], "...")
 
-    # Test the new API endpoints
+    # Test the new API endpoints. The first three checks are independent,
+    # so run them concurrently — total wall time is the slowest endpoint
+    # instead of the sum (the pooled session handles concurrent use).
     print("\n=== Testing API Endpoints ===")
-    
-    test_health()
-    print()
-    
-    test_get_today_events(access_token)
-    print()
-    
-    test_get_current_date(access_token)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        checks = [
+            pool.submit(test_health),
+            pool.submit(test_get_today_events, access_token),
+            pool.submit(test_get_current_date, access_token),
+        ]
+        for check in checks:
+            check.result()
     print()
-    
-    # Test interactive scheduling
+
+    # Test interactive scheduling (steps depend on each other, keep serial)
     test_interactive_scheduling(access_token)
     print()
\ No newline at end of file
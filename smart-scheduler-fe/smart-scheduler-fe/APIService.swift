@@ -60,7 +60,9 @@ class APIService {
         return try await get(url: url)
     }
     
-    /// Commit the schedule to Google Calendar
+    /// Commit the schedule to Google Calendar.
+    /// The backend returns 202 and performs the calendar writes in the
+    /// background; use waitForCommit to learn whether they succeeded.
     func commitSchedule(scheduleId: String) async throws -> CommitResponse {
         let accessToken = try await authManager.getValidAccessToken()
         
@@ -68,6 +70,19 @@ class APIService {
         return try await post("/schedule/commit", body: request)
     }
     
+    /// Poll the session until the background commit finishes ("done" or
+    /// "error"), returning the final schedule state.
+    func waitForCommit(scheduleId: String, maxAttempts: Int = 60) async throws -> ScheduleResponse {
+        for _ in 0..<maxAttempts {
+            let response = try await getSchedule(scheduleId: scheduleId)
+            if response.commit_state == "done" || response.commit_state == "error" {
+                return response
+            }
+            try await Task.sleep(nanoseconds: 1_000_000_000)
+        }
+        throw APIError.serverError("Timed out waiting for the commit to finish")
+    }
+    
     // MARK: - Calendar Operations
     
     /// Get today's events
@@ -163,9 +178,12 @@ struct ScheduleResponse: Codable {
     let schedule_id: String
     let schedule: [CalendarEvent]
     let message: String?
+    let commit_state: String?   // "pending" / "done" / "error" once a commit was requested
+    let commit_message: String?
 }
 
 struct CommitResponse: Codable {
+    let status: String?
     let message: String
     let schedule: [CalendarEvent]
 }
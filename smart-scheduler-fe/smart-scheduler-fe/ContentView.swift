@@ -408,7 +408,13 @@ struct ContentView: View {
         
         Task {
             do {
-                let response = try await apiService.commitSchedule(scheduleId: scheduleId)
+                // The commit endpoint only queues the calendar writes; poll
+                // until the background work resolves so failures surface
+                _ = try await apiService.commitSchedule(scheduleId: scheduleId)
+                let finalState = try await apiService.waitForCommit(scheduleId: scheduleId)
+                if finalState.commit_state == "error" {
+                    throw APIError.serverError(finalState.commit_message ?? "Commit failed")
+                }
                 await MainActor.run {
                     isLoading = false
                     toast = Toast(message: "Successfully committed schedule to calendar!", type: .success)